@@ -0,0 +1,208 @@
+import tkinter as tk
+from array import array
+from collections import deque
+
+UNDO_LIMIT = 100  # Oldest edits are forgotten beyond this depth
+
+class DrawingApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Baseline: Polygon Sketching")
+        
+        # --- STATE (Mutable) ---
+        # Shapes are flat int16 coordinate arrays: x0, y0, x1, y1, ...
+        # A finished shape array is never modified again, so undo history and
+        # the live state share those arrays by reference. The polygons list and
+        # current_poly do change, so history keeps its own copies of them.
+        self.polygons = []                # List of finished shapes
+        self.current_poly = array('h')    # Current shape being drawn
+        self.mouse_pos = (0, 0)  # Current mouse position
+        self._redraw_pending = False  # A redraw is already queued for idle time
+
+        # Canvas items kept alive between frames, so only dirty ones get touched
+        self._poly_ids = []       # One black line per finished shape (parallel to polygons)
+        self._current_segment_ids = []  # Red 2-point segments of the current shape
+        self._rubber_id = None    # Gray rubber-band preview line
+        
+        # Undo/Redo Stacks (edit operations, not snapshots)
+        self.undo_stack = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack = deque(maxlen=UNDO_LIMIT)
+
+        # --- UI SETUP ---
+        self.canvas = tk.Canvas(root, width=800, height=600, bg="white")
+        self.canvas.pack()
+        
+        controls = tk.Frame(root)
+        controls.pack()
+        tk.Button(controls, text="Undo", command=self.undo).pack(side=tk.LEFT)
+        tk.Button(controls, text="Redo", command=self.redo).pack(side=tk.LEFT)
+        tk.Button(controls, text="Clear all", command=self.clearall).pack(side=tk.LEFT)
+
+        # --- EVENTS ---
+        self.canvas.bind("<Button-1>", self.on_click)        # Left Click
+        self.canvas.bind("<Double-Button-1>", self.on_finish)# Double Click
+        self.canvas.bind("<Motion>", self.on_move)           # Mouse Move
+
+        self.redraw()
+
+    # --- LOGIC (Imperative) ---
+    
+    def clearall(self):
+        # Freeze copies of the containers: the live ones keep changing after an
+        # undo, and a later clear must restore exactly what it saw. Only the
+        # shape arrays inside are shared, since finished shapes never change.
+        self.do(("clear", tuple(self.polygons), array('h', self.current_poly)))
+        self.redraw()
+
+    def do(self, op):
+        """Applies an edit and records it for Undo"""
+        self._apply(op)
+        self.undo_stack.append(op)
+        self.redo_stack.clear() # New action clears redo history
+
+    def _apply(self, op):
+        """Performs the edit described by op on the live state"""
+        kind = op[0]
+        if kind == "pt":
+            self.current_poly.extend(op[2])
+        elif kind == "finish":
+            # Hand the array over as-is; a fresh one keeps the finished shape frozen
+            self.polygons.append(self.current_poly)
+            self.current_poly = array('h')
+        elif kind == "clear":
+            self.polygons = []
+            self.current_poly = array('h')
+
+    def _revert(self, op):
+        """Reverses the edit described by op on the live state"""
+        kind = op[0]
+        if kind == "pt":
+            del self.current_poly[-2:]
+        elif kind == "finish":
+            # Edit a copy; the finished array may still be held by a clear op
+            self.current_poly = array('h', self.polygons.pop())
+        elif kind == "clear":
+            self.polygons = list(op[1])
+            self.current_poly = array('h', op[2])
+
+    def undo(self):
+        if len(self.undo_stack) > 0:
+            # Reverse the last edit and keep it around so Redo can replay it
+            op = self.undo_stack.pop()
+            self._revert(op)
+            self.redo_stack.append(op)
+            # Patch only the items the edit touched; a clear changes everything
+            if op[0] == "pt":
+                # Undoing a click only removes its segment
+                if self._current_segment_ids:
+                    self.canvas.delete(self._current_segment_ids.pop())
+                self.update_rubber_band()
+            elif op[0] == "finish":
+                # The shape is back in progress: black line out, red segments in
+                self.canvas.delete(self._poly_ids.pop())
+                self._draw_current_segments()
+                self.update_rubber_band()
+            else:
+                self.redraw()
+
+    def redo(self):
+        if self.redo_stack:
+            # Replay the edit and make it undoable again
+            op = self.redo_stack.pop()
+            self._apply(op)
+            self.undo_stack.append(op)
+            if op[0] == "pt":
+                self._add_segment()
+                self.update_rubber_band()
+            elif op[0] == "finish":
+                self._draw_finished()
+                self.update_rubber_band()
+            else:
+                self.redraw()
+
+    def on_click(self, event):
+        # A repeated click on the last point changes nothing; don't let it wipe Redo
+        cur = self.current_poly
+        if len(cur) > 0 and cur[-2] == event.x and cur[-1] == event.y:
+            return
+        # Only the delta is recorded: which polygon gets which point
+        self.do(("pt", len(self.polygons), (event.x, event.y)))
+        self._add_segment()
+        self._schedule_redraw()
+
+    def on_move(self, event):
+        pos = (event.x, event.y)
+        if pos == self.mouse_pos:
+            return
+        self.mouse_pos = pos
+        # Without a shape in progress there is no rubber band to move
+        if len(self.current_poly) > 0:
+            self._schedule_redraw()
+
+    def on_finish(self, event):
+        if len(self.current_poly) > 4: # more than 2 points
+            self.do(("finish",))
+            self._draw_finished()
+            self._schedule_redraw()
+
+    def _draw_finished(self):
+        """Swaps the red segments for one black line of the newest finished shape"""
+        self.canvas.delete(*self._current_segment_ids)
+        self._current_segment_ids = []
+        self._poly_ids.append(self.canvas.create_line(*self.polygons[-1], fill="black", width=2))
+
+    def _add_segment(self):
+        """Draws only the segment ending at the newest point of the current shape"""
+        if len(self.current_poly) > 2: # 2+ points
+            self._current_segment_ids.append(
+                self.canvas.create_line(*self.current_poly[-4:], fill="red", width=2))
+
+    def _draw_current_segments(self):
+        """Draws the current shape from scratch, one segment per pair of points"""
+        create_line = self.canvas.create_line
+        cur = self.current_poly
+        self._current_segment_ids = [
+            create_line(*cur[i - 2:i + 2], fill="red", width=2)
+            for i in range(2, len(cur), 2)
+        ]
+
+    def _schedule_redraw(self):
+        """Coalesces bursts of events into at most one redraw per idle cycle"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self.update_rubber_band()
+
+    def update_rubber_band(self):
+        """Moves the preview line; the only item that changes on mouse move"""
+        if len(self.current_poly) > 0:
+            last_x, last_y = self.current_poly[-2], self.current_poly[-1]
+            self.canvas.coords(self._rubber_id, last_x, last_y, *self.mouse_pos)
+            self.canvas.itemconfigure(self._rubber_id, state="normal")
+        else:
+            self.canvas.itemconfigure(self._rubber_id, state="hidden")
+
+    def redraw(self):
+        """Rebuilds every canvas item; only needed when a clear is done or undone"""
+        self.canvas.delete("all")
+        
+        # Draw finished shapes (Now as open lines, not filled polygons)
+        # This prevents auto-closing the shape and prevents filling it with color.
+        # There can be many of them, so go straight to Tcl and skip the option
+        # parsing and flattening create_line would redo for every shape.
+        # Keep the raw -fill/-width options in sync with the create_line calls.
+        call, getint, path = self.canvas.tk.call, self.canvas.tk.getint, str(self.canvas)
+        self._poly_ids = [
+            getint(call(path, "create", "line", *poly, "-fill", "black", "-width", 2))
+            for poly in self.polygons
+        ]
+        
+        # Draw current shape under construction
+        self._draw_current_segments()
+            
+        # Draw rubber-band line (Preview)
+        self._rubber_id = self.canvas.create_line(0, 0, 0, 0, fill="gray", dash=(4, 2))
+        self.update_rubber_band()
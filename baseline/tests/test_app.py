@@ -0,0 +1,187 @@
+import random
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+from polysketch import app as app_module
+from polysketch.app import UNDO_LIMIT, DrawingApp
+
+
+class FakeCanvas:
+    """Just enough of tk.Canvas to run DrawingApp without a display"""
+
+    def __init__(self, *args, **kwargs):
+        self.tk = self
+        self.items = {}
+        self._next_id = 0
+
+    def __str__(self):
+        return ".canvas"
+
+    def pack(self, *args, **kwargs):
+        pass
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def create_line(self, *coords, **options):
+        self._next_id += 1
+        self.items[self._next_id] = list(coords)
+        return self._next_id
+
+    def call(self, path, command, item_type, *args):
+        coords = [a for a in args if not isinstance(a, str)][:-1]  # drop the -width value
+        return self.create_line(*coords)
+
+    def getint(self, value):
+        return int(value)
+
+    def delete(self, *ids):
+        for item in ids:
+            if item == "all":
+                self.items.clear()
+            else:
+                del self.items[item]
+
+    def coords(self, item, *coords):
+        self.items[item] = list(coords)
+
+    def itemconfigure(self, item, **options):
+        assert item in self.items
+
+
+class FakeWidget:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def pack(self, *args, **kwargs):
+        pass
+
+
+class FakeRoot:
+    def __init__(self):
+        self.idle = []
+
+    def title(self, text):
+        pass
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def flush(self):
+        idle, self.idle = self.idle, []
+        for callback in idle:
+            callback()
+
+
+@pytest.fixture
+def make_app(monkeypatch):
+    monkeypatch.setattr(app_module.tk, "Canvas", FakeCanvas)
+    monkeypatch.setattr(app_module.tk, "Frame", FakeWidget)
+    monkeypatch.setattr(app_module.tk, "Button", FakeWidget)
+
+    def make():
+        root = FakeRoot()
+        return root, DrawingApp(root)
+
+    return make
+
+
+def event(x, y):
+    return SimpleNamespace(x=x, y=y)
+
+
+def state(app):
+    return tuple(tuple(p) for p in app.polygons), tuple(app.current_poly)
+
+
+class SnapshotOracle:
+    """The original snapshot-based undo/redo, used as a reference model"""
+
+    def __init__(self):
+        self.polygons = ()
+        self.current = ()
+        self.undo_stack = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack = deque(maxlen=UNDO_LIMIT)
+
+    def _edit(self, polygons, current):
+        self.undo_stack.append((self.polygons, self.current))
+        self.redo_stack.clear()
+        self.polygons, self.current = polygons, current
+
+    def click(self, x, y):
+        if self.current[-2:] != (x, y):
+            self._edit(self.polygons, self.current + (x, y))
+
+    def finish(self):
+        if len(self.current) > 4:
+            self._edit(self.polygons + (self.current,), ())
+
+    def clear(self):
+        self._edit((), ())
+
+    def undo(self):
+        if self.undo_stack:
+            self.redo_stack.append((self.polygons, self.current))
+            self.polygons, self.current = self.undo_stack.pop()
+
+    def redo(self):
+        if self.redo_stack:
+            self.undo_stack.append((self.polygons, self.current))
+            self.polygons, self.current = self.redo_stack.pop()
+
+
+def test_undo_redo_across_two_clears(make_app):
+    root, app = make_app()
+    app.on_click(event(1, 1))
+    app.on_click(event(2, 2))
+    app.on_click(event(3, 3))
+    app.on_finish(event(3, 3))
+    app.clearall()
+    app.on_click(event(2, 2))
+    app.clearall()
+    for _ in range(3):
+        app.undo()
+    for _ in range(3):
+        app.redo()
+    app.undo()
+    assert state(app) == ((), (2, 2))
+    app.undo()
+    app.undo()
+    assert state(app) == (((1, 1, 2, 2, 3, 3),), ())
+    app.undo()
+    assert state(app) == ((), (1, 1, 2, 2, 3, 3))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_op_log_matches_snapshot_oracle(make_app, seed):
+    rng = random.Random(seed)
+    root, app = make_app()
+    oracle = SnapshotOracle()
+    for _ in range(3000):
+        roll = rng.random()
+        if roll < 0.3:
+            x, y = rng.randint(0, 4), rng.randint(0, 4)
+            app.on_click(event(x, y))
+            oracle.click(x, y)
+        elif roll < 0.4:
+            app.on_finish(event(0, 0))
+            oracle.finish()
+        elif roll < 0.5:
+            app.clearall()
+            oracle.clear()
+        # Undo and redo come in runs, so history is walked across several clears
+        elif roll < 0.75:
+            for _ in range(rng.randint(1, 8)):
+                app.undo()
+                oracle.undo()
+        else:
+            for _ in range(rng.randint(1, 8)):
+                app.redo()
+                oracle.redo()
+        root.flush()
+        assert state(app) == (oracle.polygons, oracle.current)
+        # One canvas item per finished shape and segment, plus the rubber band
+        segments = max(len(oracle.current) // 2 - 1, 0)
+        assert len(app.canvas.items) == len(oracle.polygons) + segments + 1